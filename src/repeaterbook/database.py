@@ -2,30 +2,46 @@
 
 from __future__ import annotations
 
-__all__: tuple[str, ...] = ("RepeaterBook",)
+__all__: tuple[str, ...] = ("MEMORY_DATABASE", "RepeaterBook")
 
 from functools import cached_property
-from typing import TYPE_CHECKING
+from itertools import islice
+from typing import TYPE_CHECKING, Final
 
 import attrs
 from anyio import Path
 from loguru import logger
+from sqlalchemy.dialects.sqlite import insert
 from sqlmodel import Session, SQLModel, create_engine, delete, select
 
 from repeaterbook.models import (
     Repeater,
 )
+from repeaterbook.queries import filter_radius, square
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterable, Sequence
 
-    from sqlalchemy import Engine
+    from sqlalchemy import Engine, Table
     from sqlalchemy.sql._typing import _ColumnExpressionArgument
 
+    from repeaterbook.utils import Radius
+
+_TABLE: Final[Table] = Repeater.__table__  # type: ignore[attr-defined]
+
+MEMORY_DATABASE: Final = ":memory:"
+"""Database name that selects a transient in-memory SQLite database."""
+
 
 @attrs.frozen
 class RepeaterBook:
-    """Local database for repeater data from the RepeaterBook.com API."""
+    """Local database for repeater data from the RepeaterBook.com API.
+
+    Attributes:
+        working_dir: Directory containing the database file.
+        database: Database file name. Use `":memory:"` for a transient in-memory
+            database, which lives as long as this instance's engine.
+    """
 
     working_dir: Path = attrs.Factory(Path)
     database: str = "repeaterbook.db"
@@ -38,6 +54,8 @@ class RepeaterBook:
     @property
     def database_uri(self) -> str:
         """Database URI."""
+        if self.database == MEMORY_DATABASE:
+            return "sqlite://"
         return f"sqlite:///{self.database_path}"
 
     @cached_property
@@ -49,13 +67,39 @@ class RepeaterBook:
         """Initialize database."""
         SQLModel.metadata.create_all(self.engine)
 
-    def populate(self, repeaters: Iterable[Repeater]) -> None:
-        """Populate internal database."""
+    def populate(
+        self, repeaters: Iterable[Repeater], *, batch_size: int = 1000
+    ) -> None:
+        """Populate internal database.
+
+        Repeaters are upserted in batches of `batch_size` within a single transaction,
+        so large iterables are never fully materialized as rows.
+
+        Raises:
+            ValueError: If `batch_size` is less than 1.
+        """
+        if batch_size < 1:
+            msg = f"Batch size must be at least 1, got {batch_size}"
+            raise ValueError(msg)
+
         self.init_db()
 
+        # One executemany upsert per batch, instead of a merge (SELECT + write) per row.
+        statement = insert(Repeater)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(_TABLE.primary_key.columns),
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in _TABLE.columns
+                if not column.primary_key
+            },
+        )
+        iterator = iter(repeaters)
         with Session(self.engine) as session:
-            for repeater in repeaters:
-                session.merge(repeater)
+            while batch := [
+                repeater.model_dump() for repeater in islice(iterator, batch_size)
+            ]:
+                session.execute(statement, batch)
             session.commit()
 
         logger.info("Populated repeaters.")
@@ -73,6 +117,32 @@ class RepeaterBook:
 
         return repeaters
 
+    def query_radius(
+        self,
+        radius: Radius,
+        *where: _ColumnExpressionArgument[bool] | bool,
+        limit: int | None = None,
+        yield_per: int = 1000,
+    ) -> list[Repeater]:
+        """Query the database for repeaters within a radius, sorted by distance.
+
+        Only repeaters within the radius' `square` are loaded from the database, then
+        `filter_radius` drops the ones in the square's corners.
+        Rows are streamed in chunks of `yield_per`, so only the repeaters within the
+        radius are kept in memory.
+        If `limit` is given, only the `limit` closest repeaters are returned.
+
+        Raises:
+            ValueError: If `limit` is less than 1.
+        """
+        with Session(self.engine) as session:
+            statement = (
+                select(Repeater)
+                .where(square(radius), *where)
+                .execution_options(yield_per=yield_per)
+            )
+            return filter_radius(session.exec(statement), radius, limit=limit)
+
     def truncate(self) -> None:
         """Truncate the database."""
         with Session(self.engine) as session:
@@ -30,7 +30,7 @@ __all__: tuple[str, ...] = (
 from datetime import date
 from decimal import Decimal
 from enum import Enum, auto
-from typing import Literal, TypeAlias, TypedDict
+from typing import Final, Literal, TypeAlias, TypedDict
 
 import attrs
 from pycountry.db import Country  # noqa: TC002
@@ -81,6 +81,13 @@ class ServiceType(Enum):
     GMRS = auto()
 
 
+# Coordinate bounds, built once instead of on every validator call.
+_MIN_LATITUDE: Final = Decimal(-90)
+_MAX_LATITUDE: Final = Decimal(90)
+_MIN_LONGITUDE: Final = Decimal(-180)
+_MAX_LONGITUDE: Final = Decimal(180)
+
+
 class Repeater(SQLModel, table=True):
     """Repeater."""
 
@@ -135,7 +142,7 @@ class Repeater(SQLModel, table=True):
     @classmethod
     def validate_latitude(cls, v: Decimal) -> Decimal:
         """Validate latitude is within valid range."""
-        if not Decimal(-90) <= v <= Decimal(90):
+        if not _MIN_LATITUDE <= v <= _MAX_LATITUDE:
             msg = f"Latitude must be between -90 and 90, got {v}"
             raise ValueError(msg)
         return v
@@ -144,7 +151,7 @@ class Repeater(SQLModel, table=True):
     @classmethod
     def validate_longitude(cls, v: Decimal) -> Decimal:
         """Validate longitude is within valid range."""
-        if not Decimal(-180) <= v <= Decimal(180):
+        if not _MIN_LONGITUDE <= v <= _MAX_LONGITUDE:
             msg = f"Longitude must be between -180 and 180, got {v}"
             raise ValueError(msg)
         return v
@@ -12,14 +12,17 @@ __all__: tuple[str, ...] = (
 
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
+from heapq import nsmallest
+from math import cos, pi, radians, sin, tau
+from operator import itemgetter
 from typing import TYPE_CHECKING, NamedTuple
 
-from haversine import haversine  # type: ignore[import-untyped]
 from loguru import logger
 from sqlmodel import and_, or_
 
 from repeaterbook.models import Repeater
-from repeaterbook.utils import Radius, square_bounds
+from repeaterbook.utils import Radius, angular_half_widths, square_bounds
 
 if TYPE_CHECKING:  # pragma: no cover
     from collections.abc import Iterable
@@ -44,41 +47,64 @@ def square(radius: Radius) -> ColumnElement[bool]:
 def filter_radius(
     repeaters: Iterable[Repeater],
     radius: Radius,
+    *,
+    limit: int | None = None,
 ) -> list[Repeater]:
     """Filter repeaters within a given radius, and sort by distance.
 
     Use after `square` to limit the number of repeaters to check.
     This is a brute-force search, so it should be used with care.
-    """
-
-    class RepDist(NamedTuple):
-        """Repeater distance."""
-
-        repeater: Repeater
-        distance: float
+    If `limit` is given, only the `limit` closest repeaters are returned.
 
-    rep_dists: list[RepDist] = []
+    Raises:
+        ValueError: If `limit` is less than 1.
+    """
+    if limit is not None and limit < 1:
+        msg = f"Limit must be at least 1, got {limit}"
+        raise ValueError(msg)
+
+    # Haversine, inlined so the origin's trigonometry is only computed once.
+    # Repeaters are compared by the haversine term itself (`hav`), which grows
+    # monotonically with distance, so no per-repeater sqrt/asin is needed.
+    origin_lat = radians(radius.origin.lat)
+    origin_lon = radians(radius.origin.lon)
+    cos_origin_lat = cos(origin_lat)
+
+    # Bounding box around the circle, to skip the trigonometry for repeaters that
+    # are obviously too far. Unlike `square_bounds`, longitudes are compared across
+    # the date line instead of opening up to every longitude.
+    angle, max_dlon = angular_half_widths(radius)
+    max_hav = sin(angle / 2) ** 2
+
+    rep_havs: list[tuple[float, Repeater]] = []
     for repeater in repeaters:
-        # Calculate the distance to the repeater.
-        distance = haversine(
-            radius.origin,
-            (repeater.latitude, repeater.longitude),
-            unit=radius.unit,
+        lat = radians(repeater.latitude)
+        if abs(lat - origin_lat) > angle:
+            continue
+        lon = radians(repeater.longitude)
+        if abs((lon - origin_lon + pi) % tau - pi) > max_dlon:
+            continue
+
+        hav = (
+            sin((lat - origin_lat) / 2) ** 2
+            + cos_origin_lat * cos(lat) * sin((lon - origin_lon) / 2) ** 2
         )
+        if hav <= max_hav:
+            rep_havs.append((hav, repeater))
 
-        if distance <= radius.distance:
-            rep_dists.append(RepDist(repeater=repeater, distance=distance))
-
-    # Sort by distance.
-    rep_dists.sort(key=lambda x: x.distance)
+    # Sort by distance. Partially, if only the closest ones are needed.
+    if limit is None:
+        rep_havs.sort(key=itemgetter(0))
+    else:
+        rep_havs = nsmallest(limit, rep_havs, key=itemgetter(0))
 
     # Log the number of repeaters found.
     logger.info(
-        f"Found {len(rep_dists)} repeaters within {radius.distance} {radius.unit.name}."
+        f"Found {len(rep_havs)} repeaters within {radius.distance} {radius.unit.name}."
     )
 
     # Convert to a list of repeaters.
-    return [rep_dist.repeater for rep_dist in rep_dists]
+    return [repeater for _, repeater in rep_havs]
 
 
 class Band(NamedTuple):
@@ -102,11 +128,13 @@ class Bands(Band, Enum):
     CM_3 = Band(low=Decimal("10000.0"), high=Decimal("10500.0"))
 
 
+@lru_cache(maxsize=1024)
+def _band_clause(low: Decimal, high: Decimal) -> ColumnElement[bool]:
+    """Return a query for repeaters within a frequency range."""
+    return and_(Repeater.frequency >= low, Repeater.frequency <= high)
+
+
 def band(*bands: Band) -> ColumnElement[bool]:
     """Return a query for repeaters within a given band."""
-    return or_(
-        *(
-            (Repeater.frequency >= band.low) & (Repeater.frequency <= band.high)
-            for band in bands
-        )
-    )
+    # Clauses are immutable, so each band's clause is built once and reused.
+    return or_(*(_band_clause(band.low, band.high) for band in bands))
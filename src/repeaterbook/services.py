@@ -4,27 +4,37 @@ from __future__ import annotations
 
 __all__: tuple[str, ...] = (
     "BOOL_MAP",
+    "EMERGENCY_MAP",
+    "MODE_MAP",
+    "PROGRESS_MIN_BYTES",
+    "SERVICE_TYPE_MAP",
     "STATUS_MAP",
     "USE_MAP",
     "RepeaterBookAPI",
     "fetch_json",
     "json_to_model",
+    "json_to_models",
 )
 
 import asyncio
 import hashlib
-import json
+import os
 import time
-from contextlib import suppress
+from collections import OrderedDict
+from contextlib import AsyncExitStack, suppress
 from datetime import date, timedelta
 from decimal import Decimal
+from functools import cached_property, lru_cache
 from http import HTTPStatus
-from typing import Any, Final, NotRequired, TypedDict, cast
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Final, NotRequired, TypedDict, cast
+from weakref import WeakValueDictionary
 
 import aiohttp
 import attrs
 from anyio import Path
 from loguru import logger
+from pydantic_core import from_json
 from tqdm import tqdm
 from yarl import URL
 
@@ -52,6 +62,9 @@ from repeaterbook.models import (
     Use,
 )
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
 
 class APIError(Exception):
     """Generic API error for non-200 responses."""
@@ -71,66 +84,139 @@ IdentityHeaders = TypedDict(
 )
 
 
-async def fetch_json(
+PROGRESS_MIN_BYTES: Final = 1024 * 1024
+"""Responses smaller than this, or of unknown size, skip the progress bar."""
+
+# One lock per cache file, so concurrent fetches of the same URL download it once.
+# Weak values let locks disappear as soon as no fetch is holding or waiting on them.
+_CACHE_LOCKS: Final[WeakValueDictionary[str, asyncio.Lock]] = WeakValueDictionary()
+
+
+def _cache_lock(cache_file: Path) -> asyncio.Lock:
+    """Get the lock guarding a cache file."""
+    key = str(cache_file)
+    lock = _CACHE_LOCKS.get(key)
+    if lock is None:
+        lock = _CACHE_LOCKS[key] = asyncio.Lock()
+    return lock
+
+
+@lru_cache(maxsize=1024)
+def _cache_key(url: URL) -> str:
+    """Hash a URL into a cache file key.
+
+    The hash only needs to be unique per URL, not cryptographically strong. Keys are
+    memoized, as the same export URLs tend to be fetched repeatedly.
+    """
+    return hashlib.blake2b(str(url).encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def fetch_json(  # noqa: PLR0913
     url: URL,
     *,
     headers: IdentityHeaders | None = None,
     cache_dir: Path | None = None,
     max_cache_age: timedelta = timedelta(seconds=3600),
-    chunk_size: int = 1024,
-) -> Any:  # noqa: ANN401 - json.loads() returns Any; validation done by callers
+    chunk_size: int = 1024 * 1024,
+    session: aiohttp.ClientSession | None = None,
+) -> Any:  # noqa: ANN401 - from_json() returns Any; validation done by callers
     """Fetches JSON data from the specified URL using a streaming response.
 
     - If a cached copy exists and is recent (not older than max_cache_age seconds) and
       not forced, it loads and returns the cached data.
     - Otherwise, it streams the data in chunks while displaying a progress bar, caches
       it, and returns the parsed JSON data.
+
+    Pass a `session` to reuse its connection pool across calls; otherwise a
+    short-lived session is opened for this request.
+    """
+    data, _ = await _fetch_json(
+        url,
+        headers=headers,
+        cache_dir=cache_dir,
+        max_cache_age=max_cache_age,
+        chunk_size=chunk_size,
+        session=session,
+    )
+    return data
+
+
+async def _fetch_json(  # noqa: PLR0913
+    url: URL,
+    *,
+    headers: IdentityHeaders | None,
+    cache_dir: Path | None,
+    max_cache_age: timedelta,
+    chunk_size: int,
+    session: aiohttp.ClientSession | None,
+) -> tuple[Any, int]:
+    """Fetches JSON data, along with when it was fetched from the API.
+
+    See `fetch_json`. The fetch time is in wall-clock nanoseconds (`time.time_ns`),
+    and for cached data it is the cache file's modification time.
     """
     # Create a unique filename for caching based on the URL hash.
     if cache_dir is None:
         cache_dir = Path()
-    hashed_url = hashlib.sha256(str(url).encode("utf-8")).hexdigest()
+    hashed_url = _cache_key(url)
     cache_file = cache_dir / f"api_cache_{hashed_url}.json"
     temp_file = cache_dir / f"api_cache_{hashed_url}.tmp"
 
-    # Check if fresh cached data exists using a single stat call.
-    with suppress(FileNotFoundError, json.JSONDecodeError):
-        stat = await cache_file.stat()
-        file_age = time.time() - stat.st_mtime
-        if file_age < max_cache_age.total_seconds():
-            logger.info("Using cached data.")
-            return json.loads(await cache_file.read_text(encoding="utf-8"))
-
-    # Cache doesn't exist or is invalid, continue to fetch
-    logger.info("Fetching new data from API...")
-    async with (
-        aiohttp.ClientSession(
-            headers=cast("dict[str, str] | None", headers)
-        ) as session,
-        session.get(url) as response,
-    ):
-        try:
-            response.raise_for_status()
-        except aiohttp.ClientResponseError as e:
-            raise APIError(status=response.status, message=str(e)) from e
-        # Write to temp file first for atomic cache updates.
-        async with await temp_file.open("wb") as f:
+    async with _cache_lock(cache_file):
+        # Check if fresh cached data exists using a single stat call. Holding the
+        # lock means a concurrent fetch of the same URL waits, then hits the cache.
+        with suppress(FileNotFoundError, ValueError):
+            # A stat is cheaper than handing it off to a worker thread, so it runs
+            # inline; only the (potentially large) read is done asynchronously.
+            stat = os.stat(cache_file)  # noqa: PTH116
+            # Compare integer nanoseconds to avoid float rounding on the mtime.
+            file_age_ns = time.time_ns() - stat.st_mtime_ns
+            if file_age_ns < max_cache_age // timedelta(microseconds=1) * 1_000:
+                logger.info("Using cached data.")
+                return from_json(await cache_file.read_bytes()), stat.st_mtime_ns
+
+        # Cache doesn't exist or is invalid, continue to fetch
+        logger.info("Fetching new data from API...")
+        fetched_ns = time.time_ns()
+        async with AsyncExitStack() as stack:
+            if session is None:
+                session = await stack.enter_async_context(aiohttp.ClientSession())
+            response = await stack.enter_async_context(
+                session.get(url, headers=cast("dict[str, str] | None", headers))
+            )
+            try:
+                response.raise_for_status()
+            except aiohttp.ClientResponseError as e:
+                raise APIError(status=response.status, message=str(e)) from e
+            # Buffer the body in memory; it is parsed from there and written to
+            # disk in a single call instead of once per chunk.
+            body = bytearray()
             with tqdm(
                 total=response.content_length,
                 unit="B",
                 unit_scale=True,
+                # Only draw a bar for large responses of known size, and let tqdm
+                # (`disable=None`) skip it when stderr is not a terminal.
+                disable=(
+                    None
+                    if (response.content_length or 0) >= PROGRESS_MIN_BYTES
+                    else True
+                ),
             ) as progress:
                 async for chunk in response.content.iter_chunked(chunk_size):
-                    await f.write(chunk)
+                    body += chunk
                     progress.update(len(chunk))
 
-    # Atomic rename from temp file to cache file.
-    # This prevents race conditions where concurrent requests might read
-    # a partially written cache file.
-    await temp_file.rename(cache_file)
+        # Parse before caching, so a malformed response is never written to disk.
+        data = from_json(body)
+
+        # Write to temp file first, then rename atomically.
+        # This prevents race conditions where concurrent requests might read
+        # a partially written cache file.
+        await temp_file.write_bytes(body)
+        await temp_file.rename(cache_file)
 
-    # After saving the file, load and parse the JSON data.
-    return json.loads(await cache_file.read_text(encoding="utf-8"))
+    return data, fetched_ns
 
 
 BOOL_MAP: Final[dict[str | int, bool]] = {
@@ -152,17 +238,122 @@ STATUS_MAP: Final[dict[str, Status]] = {
     "Off-air": Status.OFF_AIR,
     "On-air": Status.ON_AIR,
     "Unknown": Status.UNKNOWN,
+    "": Status.UNKNOWN,  # Some export payloads leave the status empty.
 }
 
+MODE_MAP: Final[dict[Mode, ModeJSON]] = {
+    Mode.ANALOG: "analog",
+    Mode.DMR: "DMR",
+    Mode.NXDN: "NXDN",
+    Mode.P25: "P25",
+    Mode.TETRA: "tetra",
+}
+
+EMERGENCY_MAP: Final[dict[Emergency, EmergencyJSON]] = {
+    Emergency.ARES: "ARES",
+    Emergency.RACES: "RACES",
+    Emergency.SKYWARN: "SKYWARN",
+    Emergency.CANWARN: "CANWARN",
+}
+
+SERVICE_TYPE_MAP: Final[dict[ServiceType, ServiceTypeJSON]] = {
+    ServiceType.GMRS: "GMRS",
+}
+
+
+# Model fields filled from optional RepeaterBook text keys, empty meaning `None`.
+_OPTIONAL_STR_FIELDS: Final[tuple[tuple[str, str], ...]] = (
+    ("pl_ctcss_uplink", "PL"),
+    ("pl_ctcss_tsq_downlink", "TSQ"),
+    ("landmark", "Landmark"),
+    ("country", "Country"),
+    ("county", "County"),
+    ("state", "State"),
+    ("callsign", "Callsign"),
+    ("ares", "ARES"),
+    ("races", "RACES"),
+    ("skywarn", "SKYWARN"),
+    ("canwarn", "CANWARN"),
+    ("allstar_node", "AllStar Node"),
+    ("echolink_node", "EchoLink Node"),
+    ("irlp_node", "IRLP Node"),
+    ("wires_node", "Wires Node"),
+    ("dmr_color_code", "DMR Color Code"),
+    ("dmr_id", "DMR ID"),
+    ("p_25_nac", "P-25 NAC"),
+    ("m17_can", "M17 CAN"),
+    ("tetra_mcc", "Tetra MCC"),
+    ("tetra_mnc", "Tetra MNC"),
+    ("notes", "Notes"),
+)
+
+# Model capability flags filled from RepeaterBook "Yes"/"No" keys.
+_CAPABILITY_FIELDS: Final[tuple[tuple[str, str], ...]] = (
+    ("analog_capable", "FM Analog"),
+    ("dmr_capable", "DMR"),
+    ("d_star_capable", "D-Star"),
+    ("nxdn_capable", "NXDN"),
+    ("apco_p_25_capable", "APCO P-25"),
+    ("m17_capable", "M17"),
+    ("tetra_capable", "Tetra"),
+    ("yaesu_system_fusion_capable", "System Fusion"),
+)
+
 
 def parse_date(date_str: str) -> date:
-    """Parses a date string in the format YYYY-MM-DD."""
+    """Parses a date string in the format YYYY-MM-DD.
+
+    Returns `date.min` if the string is not a valid date.
+    """
+    # Reject anything not shaped like YYYY-MM-DD (empty strings are common) without
+    # going through exception handling.
+    if not (
+        len(date_str) == 10  # noqa: PLR2004
+        and date_str[4] == date_str[7] == "-"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:].isdigit()
+    ):
+        return date.min
     try:
         return date.fromisoformat(date_str)
     except ValueError:
         return date.min
 
 
+def _str(j: RepeaterJSON, key: str) -> str:
+    """Safely parse RepeaterBook string fields."""
+    v = j.get(key, "")
+    return "" if v is None else str(v)
+
+
+def _decimal(j: RepeaterJSON, key: str) -> Decimal:
+    """Safely parse RepeaterBook decimal fields."""
+    v = j.get(key)
+    if v is None:
+        msg = f"Missing required decimal field: {key}"
+        raise ValueError(msg)
+    return Decimal(str(v))
+
+
+def _bool(j: RepeaterJSON, key: str, *, default: bool = False) -> bool:
+    """Parse RepeaterBook boolean-ish fields.
+
+    RepeaterBook uses a mix of "Yes"/"No" strings and 1/0 ints.
+    Missing/unknown values fall back to `default`.
+    """
+    v = j.get(key)
+    if not (isinstance(v, (str, int)) or v is None):
+        msg = f"Invalid type for boolean field {key}: {type(v)}"
+        raise TypeError(msg)
+    return default if v is None else BOOL_MAP.get(v, default)
+
+
+def _parse_fm_bandwidth(value: str) -> Decimal | None:
+    """Parse FM Bandwidth field, which may include " kHz" suffix."""
+    return Decimal(value.removesuffix(" kHz")) if value else None
+
+
 def json_to_model(j: RepeaterJSON, /) -> Repeater:
     """Converts a JSON object to a Repeater model.
 
@@ -174,90 +365,55 @@ def json_to_model(j: RepeaterJSON, /) -> Repeater:
 
     This function should be resilient to those differences.
     """
+    data: dict[str, Any] = {
+        "state_id": _str(j, "State ID"),
+        "repeater_id": int(j.get("Rptr ID", 0) or 0),
+        "frequency": _decimal(j, "Frequency"),
+        "input_frequency": _decimal(j, "Input Freq"),
+        "location_nearest_city": _str(j, "Nearest City"),
+        "region": j.get("Region"),
+        "latitude": _decimal(j, "Lat"),
+        "longitude": _decimal(j, "Long"),
+        "precise": _bool(j, "Precise"),
+        "use_membership": USE_MAP.get(_str(j, "Use"), Use.OPEN),
+        "operational_status": STATUS_MAP.get(
+            _str(j, "Operational Status"), Status.UNKNOWN
+        ),
+        "fm_bandwidth": _parse_fm_bandwidth(_str(j, "FM Bandwidth")),
+        "ysf_digital_id_downlink": None,
+        "ysf_digital_id_uplink": None,
+        "ysf_dsc": None,
+        "last_update": parse_date(_str(j, "Last Update")),
+    }
+    get = j.get  # Bound once for the table-driven lookups below.
+    for field, key in _OPTIONAL_STR_FIELDS:
+        v = get(key)
+        data[field] = None if v is None or v == "" else str(v)
+    for field, key in _CAPABILITY_FIELDS:
+        data[field] = _bool(j, key)
+
+    # Validate a plain dict once; constructing a `Repeater` first would only be
+    # copied and re-validated, since table models skip validation on __init__.
+    return Repeater.model_validate(data)
+
+
+def json_to_models(results: Iterable[RepeaterJSON], /) -> list[Repeater]:
+    """Converts a batch of JSON objects to Repeater models.
+
+    A `TypeAdapter(list[Repeater])` is deliberately not used here: SQLModel table
+    models skip validation when built through a plain pydantic validator, so every
+    record goes through `Repeater.model_validate` via `json_to_model`.
+    """
+    return [json_to_model(result) for result in results]
 
-    def s(key: str) -> str:
-        """Safely parse RepeaterBook string fields."""
-        v = j.get(key, "")
-        return "" if v is None else str(v)
 
-    def d(key: str) -> Decimal:
-        """Safely parse RepeaterBook decimal fields."""
-        v = j.get(key)
-        if v is None:
-            msg = f"Missing required decimal field: {key}"
-            raise ValueError(msg)
-        return Decimal(str(v))
+# URLs are immutable, so every client can share one parsed default.
+_DEFAULT_BASE_URL: Final = URL("https://repeaterbook.com")
 
-    def b(key: str, *, default: bool = False) -> bool:
-        """Parse RepeaterBook boolean-ish fields.
 
-        RepeaterBook uses a mix of "Yes"/"No" strings and 1/0 ints.
-        Missing/unknown values fall back to `default`.
-        """
-        v = j.get(key)
-        if not (isinstance(v, (str, int)) or v is None):
-            msg = f"Invalid type for boolean field {key}: {type(v)}"
-            raise TypeError(msg)
-        return default if v is None else BOOL_MAP.get(v, default)
-
-    def parse_fm_bandwidth(value: str) -> Decimal | None:
-        """Parse FM Bandwidth field, which may include " kHz" suffix."""
-        return Decimal(value.replace(" kHz", "")) if value else None
-
-    return Repeater.model_validate(
-        Repeater(
-            state_id=s("State ID"),
-            repeater_id=int(j.get("Rptr ID", 0) or 0),
-            frequency=d("Frequency"),
-            input_frequency=d("Input Freq"),
-            pl_ctcss_uplink=s("PL") or None,
-            pl_ctcss_tsq_downlink=s("TSQ") or None,
-            location_nearest_city=s("Nearest City"),
-            landmark=s("Landmark") or None,
-            region=j.get("Region"),
-            country=s("Country") or None,
-            county=s("County") or None,
-            state=s("State") or None,
-            latitude=d("Lat"),
-            longitude=d("Long"),
-            precise=BOOL_MAP[j.get("Precise", 0)],
-            callsign=s("Callsign") or None,
-            use_membership=USE_MAP.get(s("Use"), Use.OPEN),
-            operational_status=(
-                STATUS_MAP[s("Operational Status")]
-                if s("Operational Status")
-                else Status.UNKNOWN
-            ),
-            ares=s("ARES") or None,
-            races=s("RACES") or None,
-            skywarn=s("SKYWARN") or None,
-            canwarn=s("CANWARN") or None,
-            allstar_node=s("AllStar Node") or None,
-            echolink_node=s("EchoLink Node") or None,
-            irlp_node=s("IRLP Node") or None,
-            wires_node=s("Wires Node") or None,
-            analog_capable=b("FM Analog", default=False),
-            fm_bandwidth=parse_fm_bandwidth(s("FM Bandwidth")),
-            dmr_capable=b("DMR", default=False),
-            dmr_color_code=s("DMR Color Code") or None,
-            dmr_id=s("DMR ID") or None,
-            d_star_capable=b("D-Star", default=False),
-            nxdn_capable=b("NXDN", default=False),
-            apco_p_25_capable=b("APCO P-25", default=False),
-            p_25_nac=s("P-25 NAC") or None,
-            m17_capable=b("M17", default=False),
-            m17_can=s("M17 CAN") or None,
-            tetra_capable=b("Tetra", default=False),
-            tetra_mcc=s("Tetra MCC") or None,
-            tetra_mnc=s("Tetra MNC") or None,
-            yaesu_system_fusion_capable=b("System Fusion", default=False),
-            ysf_digital_id_downlink=None,
-            ysf_digital_id_uplink=None,
-            ysf_dsc=None,
-            notes=s("Notes") or None,
-            last_update=parse_date(s("Last Update")),
-        )
-    )
+def _copy_export(export: ExportJSON) -> ExportJSON:
+    """Copy an export's results list, so callers can't change a cached export."""
+    return {"count": export["count"], "results": list(export["results"])}
 
 
 @attrs.frozen
@@ -277,9 +433,15 @@ class RepeaterBookAPI:
             Defaults to 1 hour.
         max_count: Maximum expected results per API request. Used to warn
             when response may have been trimmed. Defaults to 3500.
+        max_connections: Maximum simultaneous connections when exporting several
+            URLs at once. Defaults to 4.
+        chunk_size: Maximum size of each chunk read from streamed API responses.
+            Defaults to 1 MiB.
+        max_cached_exports: Maximum number of parsed exports kept in memory, so
+            repeated exports skip the disk cache. Use 0 to disable. Defaults to 32.
     """
 
-    base_url: URL = attrs.Factory(lambda: URL("https://repeaterbook.com"))
+    base_url: URL = _DEFAULT_BASE_URL
     app_name: str = "RepeaterBook Python Client"
     app_version: str = __version__
     app_contact: str = "micael@jarniac.dev"
@@ -289,6 +451,16 @@ class RepeaterBookAPI:
 
     max_cache_age: timedelta = timedelta(hours=1)
     max_count: int = 3500
+    max_connections: int = 4
+    chunk_size: int = 1024 * 1024
+    max_cached_exports: int = 32
+
+    # Parsed exports by URL, with the time they were fetched from the API, so repeated
+    # downloads in one process skip re-reading and re-parsing the cache file. Ordered
+    # from least to most recently used, and bounded by `max_cached_exports`.
+    _exports: OrderedDict[URL, tuple[int, ExportJSON]] = attrs.field(
+        factory=OrderedDict, init=False, repr=False, eq=False
+    )
 
     async def cache_dir(self) -> Path:
         """Cache directory for API responses."""
@@ -312,17 +484,17 @@ class RepeaterBookAPI:
             headers["Authorization"] = f"Bearer {self.app_token}"
         return headers
 
-    @property
+    @cached_property
     def url_api(self) -> URL:
         """RepeaterBook API base URL."""
         return self.base_url / "api"
 
-    @property
+    @cached_property
     def url_export_north_america(self) -> URL:
         """North-america export URL."""
         return self.url_api / "export.php"
 
-    @property
+    @cached_property
     def url_export_rest_of_world(self) -> URL:
         """Rest of world (not north-america) export URL."""
         return self.url_api / "exportROW.php"
@@ -349,23 +521,6 @@ class RepeaterBookAPI:
         - If countries are specified, route based on whether they're NA or ROW
         - If no routing hints, query both endpoints
         """
-        mode_map: dict[Mode, ModeJSON] = {
-            Mode.ANALOG: "analog",
-            Mode.DMR: "DMR",
-            Mode.NXDN: "NXDN",
-            Mode.P25: "P25",
-            Mode.TETRA: "tetra",
-        }
-        emergency_map: dict[Emergency, EmergencyJSON] = {
-            Emergency.ARES: "ARES",
-            Emergency.RACES: "RACES",
-            Emergency.SKYWARN: "SKYWARN",
-            Emergency.CANWARN: "CANWARN",
-        }
-        type_map: dict[ServiceType, ServiceTypeJSON] = {
-            ServiceType.GMRS: "GMRS",
-        }
-
         # Determine which endpoints to query based on the query parameters
         has_na_specific = bool(
             query.state_ids
@@ -376,7 +531,8 @@ class RepeaterBookAPI:
         has_row_specific = bool(query.regions)
 
         # Check if countries are specified and categorize them
-        query_countries = {country.name for country in query.countries}
+        country_names = [country.name for country in query.countries]
+        query_countries = frozenset(country_names)
         has_na_countries = bool(query_countries & self.NA_COUNTRIES)
         has_row_countries = bool(query_countries - self.NA_COUNTRIES)
 
@@ -395,58 +551,114 @@ class RepeaterBookAPI:
             query_na_endpoint = has_na_countries
             query_row_endpoint = has_row_countries
 
-        query_na = ExportNorthAmericaQuery(
-            callsign=list(query.callsigns),
-            city=list(query.cities),
-            landmark=list(query.landmarks),
-            country=[country.name for country in query.countries],
-            frequency=[str(frequency) for frequency in query.frequencies],
-            mode=[mode_map[mode] for mode in query.modes],
-            state_id=list(query.state_ids),
-            county=list(query.counties),
-            emcomm=[emergency_map[emergency] for emergency in query.emergency_services],
-            stype=[type_map[service_type] for service_type in query.service_types],
-        )
-        # Safe cast: dict comprehension preserves TypedDict structure, only removes
-        # empty values (which are optional in ExportNorthAmericaQuery).
-        query_na = cast(
-            "ExportNorthAmericaQuery", {k: v for k, v in query_na.items() if v}
-        )
-
-        query_world = ExportWorldQuery(
-            callsign=list(query.callsigns),
-            city=list(query.cities),
-            landmark=list(query.landmarks),
-            country=[country.name for country in query.countries],
-            frequency=[str(frequency) for frequency in query.frequencies],
-            mode=[mode_map[mode] for mode in query.modes],
-            region=list(query.regions),
-        )
-        # Safe cast: dict comprehension preserves TypedDict structure, only removes
-        # empty values (which are optional in ExportWorldQuery).
-        query_world = cast(
-            "ExportWorldQuery", {k: v for k, v in query_world.items() if v}
-        )
+        # Parameters shared by both endpoints are converted once.
+        callsigns = list(query.callsigns)
+        cities = list(query.cities)
+        landmarks = list(query.landmarks)
+        frequencies = [str(frequency) for frequency in query.frequencies]
+        modes = [MODE_MAP[mode] for mode in query.modes]
 
+        # Only build the query for the endpoints that will actually be used.
         # Safe casts: URL % operator expects dict[str, str], and TypedDict values
         # are all list[str] which serialize correctly for query parameters.
         urls: set[URL] = set()
         if query_na_endpoint:
-            na_params = cast("dict[str, str]", query_na)
+            query_na = ExportNorthAmericaQuery(
+                callsign=callsigns,
+                city=cities,
+                landmark=landmarks,
+                country=country_names,
+                frequency=frequencies,
+                mode=modes,
+                state_id=list(query.state_ids),
+                county=list(query.counties),
+                emcomm=[
+                    EMERGENCY_MAP[emergency] for emergency in query.emergency_services
+                ],
+                stype=[
+                    SERVICE_TYPE_MAP[service_type]
+                    for service_type in query.service_types
+                ],
+            )
+            # Safe cast: dict comprehension preserves TypedDict structure, only
+            # removes empty values (which are optional in ExportNorthAmericaQuery).
+            na_params = cast("dict[str, str]", {k: v for k, v in query_na.items() if v})
             urls.add(self.url_export_north_america % na_params)
         if query_row_endpoint:
-            row_params = cast("dict[str, str]", query_world)
+            query_world = ExportWorldQuery(
+                callsign=callsigns,
+                city=cities,
+                landmark=landmarks,
+                country=country_names,
+                frequency=frequencies,
+                mode=modes,
+                region=list(query.regions),
+            )
+            # Safe cast: dict comprehension preserves TypedDict structure, only
+            # removes empty values (which are optional in ExportWorldQuery).
+            row_params = cast(
+                "dict[str, str]", {k: v for k, v in query_world.items() if v}
+            )
             urls.add(self.url_export_rest_of_world % row_params)
         return urls
 
-    async def export_json(self, url: URL) -> ExportJSON:
-        """Export data for given URL."""
+    def session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session with a bounded, keep-alive connection pool."""
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections, ttl_dns_cache=300
+            ),
+        )
+
+    def _cached_export(self, url: URL) -> ExportJSON | None:
+        """Get a parsed export from memory, if it is not older than `max_cache_age`.
+
+        Expired exports are dropped.
+        """
+        if (cached := self._exports.get(url)) is None:
+            return None
+        fetched_ns, export = cached
+        max_age_ns = self.max_cache_age // timedelta(microseconds=1) * 1_000
+        if time.time_ns() - fetched_ns >= max_age_ns:
+            del self._exports[url]
+            return None
+        self._exports.move_to_end(url)
+        return export
+
+    def _cache_export(self, url: URL, fetched_ns: int, export: ExportJSON) -> None:
+        """Keep a parsed export in memory, evicting the least recently used one."""
+        if self.max_cached_exports < 1:
+            return
+        self._exports[url] = (fetched_ns, export)
+        self._exports.move_to_end(url)
+        if len(self._exports) > self.max_cached_exports:
+            self._exports.popitem(last=False)
+
+    async def export_json(
+        self,
+        url: URL,
+        *,
+        session: aiohttp.ClientSession | None = None,
+    ) -> ExportJSON:
+        """Export data for given URL.
+
+        Results are kept in memory until they are `max_cache_age` old, counted from
+        when they were fetched from the API, so repeated exports of the same URL by
+        this client skip both the network and the disk cache. Each call returns its
+        own `results` list, but the result dicts are shared and must not be modified.
+        """
+        if (export := self._cached_export(url)) is not None:
+            return _copy_export(export)
+
         try:
-            data: ExportJSON | ExportErrorJSON | Any = await fetch_json(
+            data: ExportJSON | ExportErrorJSON | Any
+            data, fetched_ns = await _fetch_json(
                 url,
                 headers=self.headers,
                 cache_dir=await self.cache_dir(),
                 max_cache_age=self.max_cache_age,
+                chunk_size=self.chunk_size,
+                session=session,
             )
         except APIError as e:
             msg = f"API request failed for {url}"
@@ -477,22 +689,48 @@ class RepeaterBookAPI:
         if data["count"] != len(data["results"]):
             logger.warning("Mismatched count and length of results.")
 
-        return data
+        self._cache_export(url, fetched_ns, data)
+        return _copy_export(data)
 
     async def export_multi_json(self, urls: set[URL]) -> list[ExportJSON]:
-        """Export data for given URLs."""
-        tasks = [self.export_json(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        """Export data for given URLs.
+
+        Requests run concurrently over a single shared session, so connections are
+        reused and at most `max_connections` are open at once. If one request fails,
+        the others are cancelled and its error is raised, chained to an
+        `ExceptionGroup` with every request's error.
+        """
+        try:
+            async with self.session() as session, asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self.export_json(url, session=session))
+                    for url in urls
+                ]
+        except ExceptionGroup as e:
+            # Surface the underlying error, as callers expect the library's own
+            # exception types rather than a group. The group stays reachable as its
+            # cause, in case several requests failed.
+            raise e.exceptions[0] from e
+        return [task.result() for task in tasks]
 
     async def download(self, query: ExportQuery) -> list[Repeater]:
         """Download repeaters."""
-        data = await self.export_multi_json(self.urls_export(query))
+        return await self.download_many([query])
 
-        results: list[RepeaterJSON] = []
-        for export in data:
-            results.extend(export["results"])
+    async def download_many(self, queries: Iterable[ExportQuery]) -> list[Repeater]:
+        """Download repeaters for several queries at once.
 
-        repeaters = [json_to_model(result) for result in results]
+        Export URLs shared between queries are only fetched once. Repeaters matched
+        by more than one query may appear more than once in the result.
+        """
+        urls: set[URL] = set()
+        for query in queries:
+            urls |= self.urls_export(query)
+        data = await self.export_multi_json(urls)
+
+        repeaters = json_to_models(
+            chain.from_iterable(export["results"] for export in data)
+        )
 
         logger.info(f"Downloaded {len(repeaters)} repeaters.")
         return repeaters
@@ -6,12 +6,16 @@ __all__: tuple[str, ...] = (
     "LatLon",
     "Radius",
     "SquareBounds",
+    "angular_half_widths",
+    "earth_radius",
     "square_bounds",
 )
 
+from functools import cache, lru_cache
+from math import asin, cos, degrees, pi, radians, sin
 from typing import NamedTuple
 
-from haversine import Direction, Unit, inverse_haversine  # type: ignore[import-untyped]
+from haversine import Unit, haversine  # type: ignore[import-untyped]
 
 
 class LatLon(NamedTuple):
@@ -38,26 +42,49 @@ class SquareBounds(NamedTuple):
     west: float
 
 
+@cache
+def earth_radius(unit: Unit = Unit.KILOMETERS) -> float:
+    """Get the Earth's average radius, as used by `haversine`, in the given unit."""
+    # The length of one degree of arc, scaled to one radian.
+    return float(haversine((0.0, 0.0), (0.0, 1.0), unit=unit)) / radians(1.0)
+
+
+def angular_half_widths(radius: Radius) -> tuple[float, float]:
+    """Get the latitude and longitude half-widths of a radius, in radians.
+
+    Every point within the radius is at most these angles away from the origin, in
+    latitude and longitude respectively. If a pole is within the radius, every
+    longitude is too, and the longitude half-width is `pi`.
+    """
+    angle = min(radius.distance / earth_radius(radius.unit), pi)
+    origin_lat = radians(radius.origin.lat)
+    if abs(origin_lat) + angle >= pi / 2:
+        return angle, pi
+
+    # The circle's widest longitudes are north of due east/west of the origin (or
+    # south, in the southern hemisphere), so they are computed directly.
+    return angle, asin(sin(angle) / cos(origin_lat))
+
+
+@lru_cache(maxsize=1024)
 def square_bounds(radius: Radius) -> SquareBounds:
-    """Get square bounds around a point."""
-    north = inverse_haversine(
-        radius.origin, radius.distance, Direction.NORTH, unit=radius.unit
-    )[0]
-    south = inverse_haversine(
-        radius.origin, radius.distance, Direction.SOUTH, unit=radius.unit
-    )[0]
-    east = inverse_haversine(
-        radius.origin, radius.distance, Direction.EAST, unit=radius.unit
-    )[1]
-    west = inverse_haversine(
-        radius.origin, radius.distance, Direction.WEST, unit=radius.unit
-    )[1]
+    """Get square bounds around a point.
+
+    The bounds are the smallest latitude/longitude box containing every point within
+    the radius, so filtering by them never drops a point that is within the radius.
+    Results are cached, as the same radius is often queried repeatedly.
+    """
+    half_lat, half_lon = map(degrees, angular_half_widths(radius))
+    north = radius.origin.lat + half_lat
+    south = radius.origin.lat - half_lat
+    east = radius.origin.lon + half_lon
+    west = radius.origin.lon - half_lon
 
     # If we've gone all the way around, things get messy. Just open it up to everything.
-    if south > north:
-        north = 90.0
-        south = -90.0
-    if west > east:
+    if north > 90.0 or south < -90.0:  # noqa: PLR2004
+        north = min(north, 90.0)
+        south = max(south, -90.0)
+    if east > 180.0 or west < -180.0:  # noqa: PLR2004
         west = -180.0
         east = 180.0
 
@@ -7,16 +7,26 @@ from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
+import pycountry
 import pytest
 from aiohttp import web
-from yarl import URL
+from aiohttp.test_utils import TestServer
+from anyio import Path
+
+from repeaterbook.database import MEMORY_DATABASE, RepeaterBook
+from repeaterbook.models import Repeater, Status, Use
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Iterator
+    from pathlib import Path as StdPath
 
     from aiohttp.web import Request, StreamResponse
+    from pycountry.db import Country
+    from yarl import URL
 
 # Type alias for aiohttp route handlers.
 _Handler = Callable[["Request"], Awaitable["StreamResponse"]]
@@ -31,6 +41,93 @@ def anyio_backend() -> str:
     return "asyncio"
 
 
+@pytest.fixture(scope="session")
+def sample_repeater() -> Repeater:
+    """Provide a sample Repeater shared by the whole test session.
+
+    Treat it as read-only; derive variants with `model_copy(update=...)`.
+    """
+    return Repeater(
+        state_id="CA",
+        repeater_id=123,
+        frequency=Decimal("146.940000"),
+        input_frequency=Decimal("146.340000"),
+        pl_ctcss_uplink="100.0",
+        pl_ctcss_tsq_downlink="100.0",
+        location_nearest_city="Los Angeles",
+        landmark="Downtown",
+        region=None,
+        country="United States",
+        county="Los Angeles",
+        state="California",
+        latitude=Decimal("34.0522"),
+        longitude=Decimal("-118.2437"),
+        precise=True,
+        callsign="W6ABC",
+        use_membership=Use.OPEN,
+        operational_status=Status.ON_AIR,
+        ares=None,
+        races=None,
+        skywarn=None,
+        canwarn=None,
+        allstar_node=None,
+        echolink_node=None,
+        irlp_node=None,
+        wires_node=None,
+        dmr_capable=False,
+        dmr_id=None,
+        dmr_color_code=None,
+        d_star_capable=False,
+        nxdn_capable=False,
+        apco_p_25_capable=False,
+        p_25_nac=None,
+        m17_capable=False,
+        m17_can=None,
+        tetra_capable=False,
+        tetra_mcc=None,
+        tetra_mnc=None,
+        yaesu_system_fusion_capable=False,
+        ysf_digital_id_uplink=None,
+        ysf_digital_id_downlink=None,
+        ysf_dsc=None,
+        analog_capable=True,
+        fm_bandwidth=Decimal(25),
+        notes=None,
+        last_update=date(2024, 1, 15),
+    )
+
+
+@pytest.fixture(scope="session")
+def brazil() -> Country:
+    """Provide Brazil, a country served by the rest-of-world export endpoint."""
+    return pycountry.countries.lookup("Brazil")
+
+
+@pytest.fixture(scope="session")
+def united_states() -> Country:
+    """Provide the United States, a country served by the North America endpoint."""
+    return pycountry.countries.lookup("United States")
+
+
+@pytest.fixture
+def cache_dir(tmp_path: StdPath) -> Path:
+    """Provide an existing, empty cache directory for fetch_json tests.
+
+    This is `tmp_path / "cache"`, which tests inspect through plain pathlib.
+    """
+    directory = tmp_path / "cache"
+    directory.mkdir()
+    return Path(directory)
+
+
+@pytest.fixture
+def memory_db() -> Iterator[RepeaterBook]:
+    """Provide a fresh in-memory database, avoiding disk I/O in database tests."""
+    database = RepeaterBook(database=MEMORY_DATABASE)
+    yield database
+    database.engine.dispose()
+
+
 @pytest.fixture
 def local_server() -> Any:  # noqa: ANN401
     """Provide an async context manager for spinning up a local aiohttp test server.
@@ -39,7 +136,8 @@ def local_server() -> Any:  # noqa: ANN401
         async with local_server(my_handler) as url:
             response = await fetch_json(url, ...)
 
-    The server binds to an ephemeral port on 127.0.0.1 and returns the base URL.
+    The server is aiohttp's own TestServer, bound to an ephemeral port on 127.0.0.1;
+    the URL of the handler's path is returned.
     """
 
     @asynccontextmanager
@@ -50,16 +148,11 @@ def local_server() -> Any:  # noqa: ANN401
         app = web.Application()
         app.router.add_get(path, handler)
 
-        runner = web.AppRunner(app)
-        await runner.setup()
-        site = web.TCPSite(runner, "127.0.0.1", 0)
-        await site.start()
-
+        server = TestServer(app, host="127.0.0.1")
+        await server.start_server()
         try:
-            # Get ephemeral port from the bound socket.
-            port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]  # noqa: SLF001
-            yield URL.build(scheme="http", host="127.0.0.1", port=port, path=path)
+            yield server.make_url(path)
         finally:
-            await runner.cleanup()
+            await server.close()
 
     return _create_server
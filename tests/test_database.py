@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
 import pytest
 
-from repeaterbook.database import RepeaterBook
+from repeaterbook.database import MEMORY_DATABASE, RepeaterBook
 from repeaterbook.models import Repeater, Status, Use
+from repeaterbook.queries import filter_radius
+from repeaterbook.utils import LatLon, Radius
 
 if TYPE_CHECKING:
     from pathlib import Path as StdPath
@@ -17,59 +18,6 @@ if TYPE_CHECKING:
 from anyio import Path
 
 
-@pytest.fixture
-def sample_repeater() -> Repeater:
-    """Create a sample Repeater for testing."""
-    return Repeater(
-        state_id="CA",
-        repeater_id=123,
-        frequency=Decimal("146.940000"),
-        input_frequency=Decimal("146.340000"),
-        pl_ctcss_uplink="100.0",
-        pl_ctcss_tsq_downlink="100.0",
-        location_nearest_city="Los Angeles",
-        landmark="Downtown",
-        region=None,
-        country="United States",
-        county="Los Angeles",
-        state="California",
-        latitude=Decimal("34.0522"),
-        longitude=Decimal("-118.2437"),
-        precise=True,
-        callsign="W6ABC",
-        use_membership=Use.OPEN,
-        operational_status=Status.ON_AIR,
-        ares=None,
-        races=None,
-        skywarn=None,
-        canwarn=None,
-        allstar_node=None,
-        echolink_node=None,
-        irlp_node=None,
-        wires_node=None,
-        dmr_capable=False,
-        dmr_id=None,
-        dmr_color_code=None,
-        d_star_capable=False,
-        nxdn_capable=False,
-        apco_p_25_capable=False,
-        p_25_nac=None,
-        m17_capable=False,
-        m17_can=None,
-        tetra_capable=False,
-        tetra_mcc=None,
-        tetra_mnc=None,
-        yaesu_system_fusion_capable=False,
-        ysf_digital_id_uplink=None,
-        ysf_digital_id_downlink=None,
-        ysf_dsc=None,
-        analog_capable=True,
-        fm_bandwidth=Decimal(25),
-        notes=None,
-        last_update=date(2024, 1, 15),
-    )
-
-
 class TestRepeaterBookDatabase:
     """Tests for RepeaterBook database wrapper."""
 
@@ -85,6 +33,11 @@ class TestRepeaterBookDatabase:
         assert str(rb.database_uri).startswith("sqlite:///")
         assert "repeaterbook.db" in rb.database_uri
 
+    def test_memory_database_uri(self) -> None:
+        """The in-memory database name should map to an in-memory SQLite URI."""
+        rb = RepeaterBook(database=MEMORY_DATABASE)
+        assert rb.database_uri == "sqlite://"
+
     def test_custom_database_name(self, tmp_path: StdPath) -> None:
         """Custom database name should be used."""
         rb = RepeaterBook(working_dir=Path(tmp_path), database="custom.db")
@@ -94,160 +47,178 @@ class TestRepeaterBookDatabase:
         """init_db should create the database tables."""
         rb = RepeaterBook(working_dir=Path(tmp_path))
         rb.init_db()
+        rb.engine.dispose()
         # Check that database file exists
         assert (tmp_path / "repeaterbook.db").exists()
 
     def test_populate_inserts_repeaters(
-        self, tmp_path: StdPath, sample_repeater: Repeater
+        self, memory_db: RepeaterBook, sample_repeater: Repeater
     ) -> None:
         """Populate should insert repeaters into the database."""
-        rb = RepeaterBook(working_dir=Path(tmp_path))
-        rb.populate([sample_repeater])
+        memory_db.populate([sample_repeater])
 
         # Query should return the repeater
-        results = rb.query()
+        results = memory_db.query()
         assert len(results) == 1
         assert results[0].state_id == "CA"
         assert results[0].repeater_id == 123
 
     def test_populate_merges_duplicates(
-        self, tmp_path: StdPath, sample_repeater: Repeater
+        self, memory_db: RepeaterBook, sample_repeater: Repeater
     ) -> None:
         """Populate should merge (update) existing repeaters."""
-        rb = RepeaterBook(working_dir=Path(tmp_path))
-
         # Insert initial repeater
-        rb.populate([sample_repeater])
+        memory_db.populate([sample_repeater])
 
         # Modify and re-insert (same primary key)
-        modified = Repeater(
-            state_id=sample_repeater.state_id,
-            repeater_id=sample_repeater.repeater_id,
-            frequency=sample_repeater.frequency,
-            input_frequency=sample_repeater.input_frequency,
-            pl_ctcss_uplink=sample_repeater.pl_ctcss_uplink,
-            pl_ctcss_tsq_downlink=sample_repeater.pl_ctcss_tsq_downlink,
-            location_nearest_city="Updated City",  # Changed
-            landmark=sample_repeater.landmark,
-            region=sample_repeater.region,
-            country=sample_repeater.country,
-            county=sample_repeater.county,
-            state=sample_repeater.state,
-            latitude=sample_repeater.latitude,
-            longitude=sample_repeater.longitude,
-            precise=sample_repeater.precise,
-            callsign=sample_repeater.callsign,
-            use_membership=sample_repeater.use_membership,
-            operational_status=sample_repeater.operational_status,
-            ares=sample_repeater.ares,
-            races=sample_repeater.races,
-            skywarn=sample_repeater.skywarn,
-            canwarn=sample_repeater.canwarn,
-            allstar_node=sample_repeater.allstar_node,
-            echolink_node=sample_repeater.echolink_node,
-            irlp_node=sample_repeater.irlp_node,
-            wires_node=sample_repeater.wires_node,
-            dmr_capable=sample_repeater.dmr_capable,
-            dmr_id=sample_repeater.dmr_id,
-            dmr_color_code=sample_repeater.dmr_color_code,
-            d_star_capable=sample_repeater.d_star_capable,
-            nxdn_capable=sample_repeater.nxdn_capable,
-            apco_p_25_capable=sample_repeater.apco_p_25_capable,
-            p_25_nac=sample_repeater.p_25_nac,
-            m17_capable=sample_repeater.m17_capable,
-            m17_can=sample_repeater.m17_can,
-            tetra_capable=sample_repeater.tetra_capable,
-            tetra_mcc=sample_repeater.tetra_mcc,
-            tetra_mnc=sample_repeater.tetra_mnc,
-            yaesu_system_fusion_capable=sample_repeater.yaesu_system_fusion_capable,
-            ysf_digital_id_uplink=sample_repeater.ysf_digital_id_uplink,
-            ysf_digital_id_downlink=sample_repeater.ysf_digital_id_downlink,
-            ysf_dsc=sample_repeater.ysf_dsc,
-            analog_capable=sample_repeater.analog_capable,
-            fm_bandwidth=sample_repeater.fm_bandwidth,
-            notes=sample_repeater.notes,
-            last_update=sample_repeater.last_update,
+        modified = sample_repeater.model_copy(
+            update={"location_nearest_city": "Updated City"}
         )
-        rb.populate([modified])
+        memory_db.populate([modified])
 
         # Should still have only 1 repeater
-        results = rb.query()
+        results = memory_db.query()
         assert len(results) == 1
         assert results[0].location_nearest_city == "Updated City"
 
+    def test_populate_preserves_field_types(
+        self, memory_db: RepeaterBook, sample_repeater: Repeater
+    ) -> None:
+        """Populated rows should round-trip decimals, enums and dates."""
+        memory_db.populate([sample_repeater])
+
+        result = memory_db.query()[0]
+        assert result.frequency == sample_repeater.frequency
+        assert result.latitude == sample_repeater.latitude
+        assert result.use_membership == Use.OPEN
+        assert result.operational_status == Status.ON_AIR
+        assert result.last_update == sample_repeater.last_update
+
+    def test_populate_in_batches(
+        self, memory_db: RepeaterBook, sample_repeater: Repeater
+    ) -> None:
+        """Populate should insert every repeater when split across batches."""
+        repeaters = (
+            sample_repeater.model_copy(update={"repeater_id": repeater_id})
+            for repeater_id in range(5)
+        )
+        memory_db.populate(repeaters, batch_size=2)
+        assert len(memory_db.query()) == 5
+
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_populate_rejects_invalid_batch_size(
+        self, memory_db: RepeaterBook, sample_repeater: Repeater, batch_size: int
+    ) -> None:
+        """Populate should reject batch sizes below 1."""
+        with pytest.raises(ValueError, match="Batch size must be at least 1"):
+            memory_db.populate([sample_repeater], batch_size=batch_size)
+
+    def test_populate_empty(self, memory_db: RepeaterBook) -> None:
+        """Populate with no repeaters should only create the tables."""
+        memory_db.populate([])
+        assert len(memory_db.query()) == 0
+
     def test_query_with_where_clause(
-        self, tmp_path: StdPath, sample_repeater: Repeater
+        self, memory_db: RepeaterBook, sample_repeater: Repeater
     ) -> None:
         """Query should filter with where clause."""
-        rb = RepeaterBook(working_dir=Path(tmp_path))
-
         # Insert multiple repeaters with different states
         repeaters = [
             sample_repeater,
-            Repeater(
-                state_id="TX",
-                repeater_id=456,
-                frequency=Decimal("147.000"),
-                input_frequency=Decimal("147.600"),
-                pl_ctcss_uplink=None,
-                pl_ctcss_tsq_downlink=None,
-                location_nearest_city="Houston",
-                landmark=None,
-                region=None,
-                country="United States",
-                county=None,
-                state="Texas",
-                latitude=Decimal("29.7604"),
-                longitude=Decimal("-95.3698"),
-                precise=True,
-                callsign="W5XYZ",
-                use_membership=Use.OPEN,
-                operational_status=Status.ON_AIR,
-                ares=None,
-                races=None,
-                skywarn=None,
-                canwarn=None,
-                allstar_node=None,
-                echolink_node=None,
-                irlp_node=None,
-                wires_node=None,
-                dmr_capable=True,
-                dmr_id="12345",
-                dmr_color_code="1",
-                d_star_capable=False,
-                nxdn_capable=False,
-                apco_p_25_capable=False,
-                p_25_nac=None,
-                m17_capable=False,
-                m17_can=None,
-                tetra_capable=False,
-                tetra_mcc=None,
-                tetra_mnc=None,
-                yaesu_system_fusion_capable=False,
-                ysf_digital_id_uplink=None,
-                ysf_digital_id_downlink=None,
-                ysf_dsc=None,
-                analog_capable=True,
-                fm_bandwidth=None,
-                notes=None,
-                last_update=date(2024, 1, 15),
+            sample_repeater.model_copy(
+                update={
+                    "state_id": "TX",
+                    "repeater_id": 456,
+                    "frequency": Decimal("147.000"),
+                    "input_frequency": Decimal("147.600"),
+                    "pl_ctcss_uplink": None,
+                    "pl_ctcss_tsq_downlink": None,
+                    "location_nearest_city": "Houston",
+                    "landmark": None,
+                    "county": None,
+                    "state": "Texas",
+                    "latitude": Decimal("29.7604"),
+                    "longitude": Decimal("-95.3698"),
+                    "callsign": "W5XYZ",
+                    "dmr_capable": True,
+                    "dmr_id": "12345",
+                    "dmr_color_code": "1",
+                    "fm_bandwidth": None,
+                }
             ),
         ]
-        rb.populate(repeaters)
+        memory_db.populate(repeaters)
 
         # Query for CA only
-        results = rb.query(Repeater.state_id == "CA")
+        results = memory_db.query(Repeater.state_id == "CA")
         assert len(results) == 1
         assert results[0].state_id == "CA"
 
         # Query for DMR capable
-        results = rb.query(Repeater.dmr_capable == True)  # noqa: E712
+        results = memory_db.query(Repeater.dmr_capable == True)  # noqa: E712
         assert len(results) == 1
         assert results[0].state_id == "TX"
 
-    def test_query_empty_database(self, tmp_path: StdPath) -> None:
+    def test_query_radius_matches_filter_radius(
+        self, memory_db: RepeaterBook, sample_repeater: Repeater
+    ) -> None:
+        """Query radius should match filtering every repeater in Python."""
+        repeaters = [
+            sample_repeater.model_copy(
+                update={
+                    "repeater_id": repeater_id,
+                    "latitude": sample_repeater.latitude + Decimal(dlat) / 2,
+                    "longitude": sample_repeater.longitude + Decimal(dlon) / 2,
+                }
+            )
+            for repeater_id, (dlat, dlon) in enumerate(
+                (dlat, dlon) for dlat in range(-3, 4) for dlon in range(-3, 4)
+            )
+        ]
+        memory_db.populate(repeaters)
+        radius = Radius(
+            origin=LatLon(
+                lat=float(sample_repeater.latitude),
+                lon=float(sample_repeater.longitude),
+            ),
+            distance=120,
+        )
+
+        results = memory_db.query_radius(radius)
+
+        expected = filter_radius(repeaters, radius)
+        assert 0 < len(expected) < len(repeaters)
+        assert [r.repeater_id for r in results] == [r.repeater_id for r in expected]
+
+        # Streaming in small chunks should not change the results.
+        results = memory_db.query_radius(radius, yield_per=2)
+        assert [r.repeater_id for r in results] == [r.repeater_id for r in expected]
+
+    def test_query_radius_with_where_clause(
+        self, memory_db: RepeaterBook, sample_repeater: Repeater
+    ) -> None:
+        """Query radius should also filter with where clause."""
+        memory_db.populate(
+            [
+                sample_repeater,
+                sample_repeater.model_copy(
+                    update={"state_id": "TX", "repeater_id": 456}
+                ),
+            ]
+        )
+        radius = Radius(
+            origin=LatLon(
+                lat=float(sample_repeater.latitude),
+                lon=float(sample_repeater.longitude),
+            ),
+            distance=10,
+        )
+
+        results = memory_db.query_radius(radius, Repeater.state_id == "TX")
+        assert [r.repeater_id for r in results] == [456]
+
+    def test_query_empty_database(self, memory_db: RepeaterBook) -> None:
         """Query on empty database should return empty list."""
-        rb = RepeaterBook(working_dir=Path(tmp_path))
-        rb.init_db()
-        results = rb.query()
+        memory_db.init_db()
+        results = memory_db.query()
         assert len(results) == 0
@@ -5,23 +5,24 @@ These tests are *offline*: they spin up a local aiohttp server.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 import pytest
 from aiohttp import web
 
+from repeaterbook.services import fetch_json
+
 if TYPE_CHECKING:
     from pathlib import Path as StdPath
 
-from anyio import Path
-
-from repeaterbook.services import fetch_json
+    from anyio import Path
 
 
 @pytest.mark.anyio
 async def test_fetch_json_uses_cache_when_fresh(
-    tmp_path: StdPath,
+    cache_dir: Path,
     local_server: Any,  # noqa: ANN401
 ) -> None:
     """Second call should hit cache even if server would return different data."""
@@ -32,9 +33,6 @@ async def test_fetch_json_uses_cache_when_fresh(
         return web.json_response({"calls": state["calls"]})
 
     async with local_server(handler) as url:
-        cache_dir = Path(tmp_path) / "cache"
-        await cache_dir.mkdir(parents=True, exist_ok=True)
-
         first = await fetch_json(url, cache_dir=cache_dir)
         second = await fetch_json(url, cache_dir=cache_dir)
 
@@ -45,7 +43,7 @@ async def test_fetch_json_uses_cache_when_fresh(
 
 @pytest.mark.anyio
 async def test_fetch_json_refreshes_cache_when_stale(
-    tmp_path: StdPath,
+    cache_dir: Path,
     local_server: Any,  # noqa: ANN401
 ) -> None:
     """If cache is stale, a new request should be made."""
@@ -56,9 +54,6 @@ async def test_fetch_json_refreshes_cache_when_stale(
         return web.json_response({"calls": state["calls"]})
 
     async with local_server(handler) as url:
-        cache_dir = Path(tmp_path) / "cache"
-        await cache_dir.mkdir(parents=True, exist_ok=True)
-
         first = await fetch_json(url, cache_dir=cache_dir)
 
         # Force staleness by setting max_cache_age=0.
@@ -70,3 +65,88 @@ async def test_fetch_json_refreshes_cache_when_stale(
         assert first == {"calls": 1}
         assert second == {"calls": expected_refreshed_count}
         assert state["calls"] == expected_refreshed_count
+
+
+@pytest.mark.anyio
+async def test_fetch_json_refetches_when_cache_is_corrupt(
+    tmp_path: StdPath,
+    cache_dir: Path,
+    local_server: Any,  # noqa: ANN401
+) -> None:
+    """An unparseable cache file should be ignored and replaced."""
+    state: dict[str, int] = {"calls": 0}
+
+    async def handler(_: web.Request) -> web.Response:
+        state["calls"] += 1
+        return web.json_response({"calls": state["calls"]})
+
+    async with local_server(handler) as url:
+        await fetch_json(url, cache_dir=cache_dir)
+        for cache_file in (tmp_path / "cache").glob("api_cache_*.json"):
+            cache_file.write_bytes(b"{not json")
+
+        second = await fetch_json(url, cache_dir=cache_dir)
+
+        expected_refreshed_count = 2
+        assert second == {"calls": expected_refreshed_count}
+        assert state["calls"] == expected_refreshed_count
+
+
+@pytest.mark.anyio
+async def test_fetch_json_concurrent_calls_share_one_request(
+    cache_dir: Path,
+    local_server: Any,  # noqa: ANN401
+) -> None:
+    """Concurrent fetches of the same URL should download it only once."""
+    state: dict[str, int] = {"calls": 0}
+
+    async def handler(_: web.Request) -> web.Response:
+        state["calls"] += 1
+        return web.json_response({"calls": state["calls"]})
+
+    async with local_server(handler) as url:
+        results = await asyncio.gather(
+            fetch_json(url, cache_dir=cache_dir),
+            fetch_json(url, cache_dir=cache_dir),
+        )
+
+        assert list(results) == [{"calls": 1}, {"calls": 1}]
+        assert state["calls"] == 1
+
+
+@pytest.mark.anyio
+async def test_fetch_json_caches_each_url_separately(
+    tmp_path: StdPath,
+    cache_dir: Path,
+    local_server: Any,  # noqa: ANN401
+) -> None:
+    """Different URLs should never share a cache file."""
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response({"q": request.query["q"]})
+
+    async with local_server(handler) as url:
+        first = await fetch_json(url % {"q": "a"}, cache_dir=cache_dir)
+        second = await fetch_json(url % {"q": "b"}, cache_dir=cache_dir)
+
+        assert first == {"q": "a"}
+        assert second == {"q": "b"}
+        assert len(list((tmp_path / "cache").glob("api_cache_*.json"))) == 2
+
+
+@pytest.mark.anyio
+async def test_fetch_json_does_not_cache_malformed_response(
+    tmp_path: StdPath,
+    cache_dir: Path,
+    local_server: Any,  # noqa: ANN401
+) -> None:
+    """A response that fails to parse should not leave a cache file behind."""
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.Response(body=b"{not json", content_type="application/json")
+
+    async with local_server(handler) as url:
+        with pytest.raises(ValueError):  # noqa: PT011
+            await fetch_json(url, cache_dir=cache_dir)
+
+        assert list((tmp_path / "cache").glob("api_cache_*")) == []
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-import pycountry
 import pytest
 from pydantic import ValidationError
 
@@ -21,6 +22,11 @@ from repeaterbook.models import (
     Use,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pycountry.db import Country
+
 
 class TestStatusEnum:
     """Tests for Status enum."""
@@ -80,58 +86,6 @@ class TestServiceTypeEnum:
 class TestRepeaterModel:
     """Tests for Repeater SQLModel."""
 
-    @pytest.fixture
-    def sample_repeater(self) -> Repeater:
-        """Create a sample Repeater instance."""
-        return Repeater(
-            state_id="CA",
-            repeater_id=123,
-            frequency=Decimal("146.940000"),
-            input_frequency=Decimal("146.340000"),
-            pl_ctcss_uplink="100.0",
-            pl_ctcss_tsq_downlink="100.0",
-            location_nearest_city="Los Angeles",
-            landmark="Downtown",
-            region=None,
-            country="United States",
-            county="Los Angeles",
-            state="California",
-            latitude=Decimal("34.0522"),
-            longitude=Decimal("-118.2437"),
-            precise=True,
-            callsign="W6ABC",
-            use_membership=Use.OPEN,
-            operational_status=Status.ON_AIR,
-            ares=None,
-            races=None,
-            skywarn=None,
-            canwarn=None,
-            allstar_node=None,
-            echolink_node=None,
-            irlp_node=None,
-            wires_node=None,
-            dmr_capable=False,
-            dmr_id=None,
-            dmr_color_code=None,
-            d_star_capable=False,
-            nxdn_capable=False,
-            apco_p_25_capable=False,
-            p_25_nac=None,
-            m17_capable=False,
-            m17_can=None,
-            tetra_capable=False,
-            tetra_mcc=None,
-            tetra_mnc=None,
-            yaesu_system_fusion_capable=False,
-            ysf_digital_id_uplink=None,
-            ysf_digital_id_downlink=None,
-            ysf_dsc=None,
-            analog_capable=True,
-            fm_bandwidth=Decimal(25),
-            notes=None,
-            last_update=date(2024, 1, 15),
-        )
-
     def test_repeater_creation(self, sample_repeater: Repeater) -> None:
         """Repeater should be created with correct values."""
         assert sample_repeater.state_id == "CA"
@@ -161,17 +115,11 @@ class TestRepeaterModel:
         assert sample_repeater.ares is None
 
 
-class TestRepeaterValidation:
-    """Tests for Repeater model validation.
-
-    Note: SQLModel table models don't validate on __init__ by default.
-    Validation is triggered via model_validate(), which is how json_to_model works.
-    """
-
-    @pytest.fixture
-    def base_data(self) -> dict[str, object]:
-        """Base valid repeater data."""
-        return {
+@pytest.fixture(scope="module")
+def base_data() -> Mapping[str, object]:
+    """Base valid repeater data, shared read-only by the module."""
+    return MappingProxyType(
+        {
             "state_id": "CA",
             "repeater_id": 1,
             "frequency": Decimal("146.94"),
@@ -219,44 +167,35 @@ class TestRepeaterValidation:
             "notes": None,
             "last_update": date(2024, 1, 1),
         }
+    )
+
+
+class TestRepeaterValidation:
+    """Tests for Repeater model validation.
+
+    Note: SQLModel table models don't validate on __init__ by default.
+    Validation is triggered via model_validate(), which is how json_to_model works.
+    """
 
-    def test_invalid_latitude_too_high(self, base_data: dict[str, object]) -> None:
-        """Latitude above 90 should raise ValidationError."""
-        base_data["latitude"] = Decimal(91)
-        with pytest.raises(ValidationError, match="Latitude must be between"):
-            Repeater.model_validate(base_data)
-
-    def test_invalid_latitude_too_low(self, base_data: dict[str, object]) -> None:
-        """Latitude below -90 should raise ValidationError."""
-        base_data["latitude"] = Decimal(-91)
-        with pytest.raises(ValidationError, match="Latitude must be between"):
-            Repeater.model_validate(base_data)
-
-    def test_invalid_longitude_too_high(self, base_data: dict[str, object]) -> None:
-        """Longitude above 180 should raise ValidationError."""
-        base_data["longitude"] = Decimal(181)
-        with pytest.raises(ValidationError, match="Longitude must be between"):
-            Repeater.model_validate(base_data)
-
-    def test_invalid_longitude_too_low(self, base_data: dict[str, object]) -> None:
-        """Longitude below -180 should raise ValidationError."""
-        base_data["longitude"] = Decimal(-181)
-        with pytest.raises(ValidationError, match="Longitude must be between"):
-            Repeater.model_validate(base_data)
-
-    def test_invalid_frequency_zero(self, base_data: dict[str, object]) -> None:
-        """Frequency of zero should raise ValidationError."""
-        base_data["frequency"] = Decimal(0)
-        with pytest.raises(ValidationError, match="Frequency must be positive"):
-            Repeater.model_validate(base_data)
-
-    def test_invalid_frequency_negative(self, base_data: dict[str, object]) -> None:
-        """Negative frequency should raise ValidationError."""
-        base_data["frequency"] = Decimal(-10)
-        with pytest.raises(ValidationError, match="Frequency must be positive"):
-            Repeater.model_validate(base_data)
-
-    def test_valid_data_passes(self, base_data: dict[str, object]) -> None:
+    @pytest.mark.parametrize(
+        ("field", "value", "match"),
+        [
+            ("latitude", Decimal(91), "Latitude must be between"),
+            ("latitude", Decimal(-91), "Latitude must be between"),
+            ("longitude", Decimal(181), "Longitude must be between"),
+            ("longitude", Decimal(-181), "Longitude must be between"),
+            ("frequency", Decimal(0), "Frequency must be positive"),
+            ("frequency", Decimal(-10), "Frequency must be positive"),
+        ],
+    )
+    def test_invalid_value_raises(
+        self, base_data: Mapping[str, object], field: str, value: Decimal, match: str
+    ) -> None:
+        """Out-of-range coordinates and non-positive frequencies should be rejected."""
+        with pytest.raises(ValidationError, match=match):
+            Repeater.model_validate({**base_data, field: value})
+
+    def test_valid_data_passes(self, base_data: Mapping[str, object]) -> None:
         """Valid data should create a Repeater without errors."""
         repeater = Repeater.model_validate(base_data)
         assert repeater.latitude == Decimal(34)
@@ -274,9 +213,8 @@ class TestExportQuery:
         assert query.countries == frozenset()
         assert query.modes == frozenset()
 
-    def test_with_countries(self) -> None:
+    def test_with_countries(self, brazil: Country) -> None:
         """ExportQuery should accept countries."""
-        brazil = pycountry.countries.lookup("Brazil")
         query = ExportQuery(countries=frozenset({brazil}))
         assert brazil in query.countries
 
@@ -135,6 +135,23 @@ class TestFilterRadius:
         assert result[1].repeater_id == 3  # San Diego
         assert result[2].repeater_id == 2  # SF (furthest)
 
+    def test_filter_radius_limit(self, sample_repeaters: list[Repeater]) -> None:
+        """filter_radius should only return the closest repeaters up to limit."""
+        la = LatLon(lat=34.0522, lon=-118.2437)
+        radius = Radius(origin=la, distance=600, unit=Unit.KILOMETERS)
+        result = filter_radius(sample_repeaters, radius, limit=2)
+        assert [r.repeater_id for r in result] == [1, 3]
+
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_filter_radius_rejects_invalid_limit(
+        self, sample_repeaters: list[Repeater], limit: int
+    ) -> None:
+        """filter_radius should reject limits below 1."""
+        la = LatLon(lat=34.0522, lon=-118.2437)
+        radius = Radius(origin=la, distance=600, unit=Unit.KILOMETERS)
+        with pytest.raises(ValueError, match="Limit must be at least 1"):
+            filter_radius(sample_repeaters, radius, limit=limit)
+
     def test_filter_radius_empty_result(self, sample_repeaters: list[Repeater]) -> None:
         """filter_radius should return empty list if no repeaters in range."""
         # Point in the Atlantic Ocean
@@ -143,6 +160,40 @@ class TestFilterRadius:
         result = filter_radius(sample_repeaters, radius)
         assert len(result) == 0
 
+    def test_filter_radius_respects_unit(
+        self, sample_repeaters: list[Repeater]
+    ) -> None:
+        """filter_radius should interpret the distance in the radius' unit."""
+        la = LatLon(lat=34.0522, lon=-118.2437)
+        # 150mi (~241km) reaches San Diego (~180km) but not SF (~550km)
+        radius = Radius(origin=la, distance=150, unit=Unit.MILES)
+        result = filter_radius(sample_repeaters, radius)
+        assert [r.repeater_id for r in result] == [1, 3]
+
+    def test_filter_radius_keeps_widest_longitudes(
+        self, sample_repeaters: list[Repeater]
+    ) -> None:
+        """Repeaters at the circle's widest longitude should not be pre-filtered out.
+
+        Away from the equator, a circle reaches further east than the point due east
+        of its center.
+        """
+        edge = sample_repeaters[0].model_copy(
+            update={"latitude": Decimal("61.2592"), "longitude": Decimal("18.1")}
+        )
+        origin = LatLon(lat=60.0, lon=0.0)
+        radius = Radius(origin=origin, distance=1000, unit=Unit.KILOMETERS)
+        assert filter_radius([edge], radius) == [edge]
+
+    def test_filter_radius_half_globe_includes_all(
+        self, sample_repeaters: list[Repeater]
+    ) -> None:
+        """A radius beyond half the Earth's circumference should include everything."""
+        atlantic = LatLon(lat=30.0, lon=-40.0)
+        radius = Radius(origin=atlantic, distance=30_000, unit=Unit.KILOMETERS)
+        result = filter_radius(sample_repeaters, radius)
+        assert len(result) == 3
+
 
 class TestBandNamedTuple:
     """Tests for Band NamedTuple."""
@@ -196,3 +247,16 @@ class TestBandQuery:
         """band() should work with multiple bands."""
         result = band(Bands.M_2.value, Bands.CM_70.value)
         assert result is not None
+
+    def test_band_matches_frequencies(self) -> None:
+        """band() should compare the frequency with each band's limits."""
+        result = band(
+            Bands.M_2.value, Band(low=Decimal("420.0"), high=Decimal("450.0"))
+        )
+        params = result.compile().params
+        assert sorted(params.values()) == [
+            Decimal("144.0"),
+            Decimal("148.0"),
+            Decimal("420.0"),
+            Decimal("450.0"),
+        ]
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import time
 from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
-import pycountry
+import aiohttp
 import pytest
 from aiohttp import web
+from pydantic import ValidationError
 from yarl import URL
 
 from repeaterbook.exceptions import (
@@ -16,6 +20,7 @@ from repeaterbook.exceptions import (
     RepeaterBookValidationError,
 )
 from repeaterbook.models import (
+    ExportJSON,
     ExportQuery,
     Mode,
     Status,
@@ -27,12 +32,15 @@ from repeaterbook.services import (
     USE_MAP,
     RepeaterBookAPI,
     json_to_model,
+    json_to_models,
     parse_date,
 )
 
 if TYPE_CHECKING:
     from pathlib import Path as StdPath
 
+    from pycountry.db import Country
+
 from anyio import Path
 
 
@@ -110,52 +118,63 @@ class TestParseDate:
         result = parse_date("")
         assert result == date.min
 
+    def test_out_of_range_date_returns_min(self) -> None:
+        """Well-formed but out-of-range date should return date.min."""
+        result = parse_date("2024-13-45")
+        assert result == date.min
+
+    def test_other_iso_formats_return_min(self) -> None:
+        """Only the YYYY-MM-DD format should be accepted."""
+        assert parse_date("20240315") == date.min
+        assert parse_date("2024-03-15T00:00") == date.min
+
+
+@pytest.fixture
+def minimal_payload() -> dict[str, Any]:
+    """Minimal valid payload."""
+    return {
+        "State ID": "CA",
+        "Rptr ID": 123,
+        "Frequency": "146.940000",
+        "Input Freq": "146.340000",
+        "PL": "",
+        "TSQ": "",
+        "Nearest City": "Los Angeles",
+        "Landmark": "",
+        "Country": "United States",
+        "Lat": "34.0522",
+        "Long": "-118.2437",
+        "Precise": 1,
+        "Callsign": "W6ABC",
+        "Use": "OPEN",
+        "Operational Status": "On-air",
+        "AllStar Node": "",
+        "EchoLink Node": "",
+        "IRLP Node": "",
+        "Wires Node": "",
+        "FM Analog": "Yes",
+        "FM Bandwidth": "",
+        "DMR": "No",
+        "DMR Color Code": "",
+        "DMR ID": "",
+        "D-Star": "No",
+        "NXDN": "No",
+        "APCO P-25": "No",
+        "P-25 NAC": "",
+        "M17": "No",
+        "M17 CAN": "",
+        "Tetra": "No",
+        "Tetra MCC": "",
+        "Tetra MNC": "",
+        "System Fusion": "No",
+        "Notes": "",
+        "Last Update": "2024-01-15",
+    }
+
 
 class TestJsonToModel:
     """Tests for json_to_model function."""
 
-    @pytest.fixture
-    def minimal_payload(self) -> dict[str, Any]:
-        """Minimal valid payload."""
-        return {
-            "State ID": "CA",
-            "Rptr ID": 123,
-            "Frequency": "146.940000",
-            "Input Freq": "146.340000",
-            "PL": "",
-            "TSQ": "",
-            "Nearest City": "Los Angeles",
-            "Landmark": "",
-            "Country": "United States",
-            "Lat": "34.0522",
-            "Long": "-118.2437",
-            "Precise": 1,
-            "Callsign": "W6ABC",
-            "Use": "OPEN",
-            "Operational Status": "On-air",
-            "AllStar Node": "",
-            "EchoLink Node": "",
-            "IRLP Node": "",
-            "Wires Node": "",
-            "FM Analog": "Yes",
-            "FM Bandwidth": "",
-            "DMR": "No",
-            "DMR Color Code": "",
-            "DMR ID": "",
-            "D-Star": "No",
-            "NXDN": "No",
-            "APCO P-25": "No",
-            "P-25 NAC": "",
-            "M17": "No",
-            "M17 CAN": "",
-            "Tetra": "No",
-            "Tetra MCC": "",
-            "Tetra MNC": "",
-            "System Fusion": "No",
-            "Notes": "",
-            "Last Update": "2024-01-15",
-        }
-
     def test_basic_fields(self, minimal_payload: dict[str, Any]) -> None:
         """Basic fields should be parsed correctly."""
         rep = json_to_model(minimal_payload)  # type: ignore[arg-type]
@@ -223,12 +242,35 @@ class TestJsonToModel:
         rep = json_to_model(minimal_payload)  # type: ignore[arg-type]
         assert rep.operational_status == Status.UNKNOWN
 
+    def test_unrecognized_values_use_defaults(
+        self, minimal_payload: dict[str, Any]
+    ) -> None:
+        """Unrecognized status and precision values should fall back to defaults."""
+        minimal_payload["Operational Status"] = "Testing"
+        minimal_payload["Precise"] = 2
+        rep = json_to_model(minimal_payload)  # type: ignore[arg-type]
+        assert rep.operational_status == Status.UNKNOWN
+        assert rep.precise is False
+
     def test_echolink_node_as_int(self, minimal_payload: dict[str, Any]) -> None:
         """EchoLink Node can be an int in some payloads."""
         minimal_payload["EchoLink Node"] = 12345
         rep = json_to_model(minimal_payload)  # type: ignore[arg-type]
         assert rep.echolink_node == "12345"
 
+    def test_invalid_latitude_raises(self, minimal_payload: dict[str, Any]) -> None:
+        """Out-of-range coordinates should fail model validation."""
+        minimal_payload["Lat"] = "91"
+        with pytest.raises(ValidationError, match="Latitude must be between"):
+            json_to_model(minimal_payload)  # type: ignore[arg-type]
+
+    def test_json_to_models_batch(self, minimal_payload: dict[str, Any]) -> None:
+        """json_to_models should convert every record, preserving order."""
+        second = {**minimal_payload, "Rptr ID": 456, "Lat": "32.7157"}
+        reps = json_to_models([minimal_payload, second])  # type: ignore[list-item]
+        assert [rep.repeater_id for rep in reps] == [123, 456]
+        assert reps[1].latitude == Decimal("32.7157")
+
 
 class TestRepeaterBookAPIUrls:
     """Tests for RepeaterBookAPI URL generation."""
@@ -252,6 +294,12 @@ class TestRepeaterBookAPIUrls:
             "https://repeaterbook.com/api/exportROW.php"
         )
 
+    def test_export_urls_are_cached(self) -> None:
+        """Endpoint URLs should be built once per client instance."""
+        api = RepeaterBookAPI()
+        assert api.url_export_north_america is api.url_export_north_america
+        assert api.url_export_rest_of_world is api.url_export_rest_of_world
+
     def test_urls_export_empty_query(self) -> None:
         """Empty query should return both NA and ROW URLs."""
         api = RepeaterBookAPI()
@@ -263,11 +311,12 @@ class TestRepeaterBookAPIUrls:
         assert any("export.php" in url for url in url_strs)  # NA
         assert any("exportROW.php" in url for url in url_strs)  # ROW
 
-    def test_urls_export_na_country_routes_to_na_only(self) -> None:
+    def test_urls_export_na_country_routes_to_na_only(
+        self, united_states: Country
+    ) -> None:
         """Query with NA country (US) should only query NA endpoint."""
         api = RepeaterBookAPI()
-        us = pycountry.countries.lookup("United States")
-        query = ExportQuery(countries=frozenset({us}))
+        query = ExportQuery(countries=frozenset({united_states}))
         urls = api.urls_export(query)
         assert len(urls) == 1
         url_str = str(next(iter(urls)))
@@ -275,10 +324,9 @@ class TestRepeaterBookAPIUrls:
         assert "exportROW" not in url_str
         assert "United+States" in url_str
 
-    def test_urls_export_row_country_routes_to_row_only(self) -> None:
+    def test_urls_export_row_country_routes_to_row_only(self, brazil: Country) -> None:
         """Query with ROW country (Brazil) should only query ROW endpoint."""
         api = RepeaterBookAPI()
-        brazil = pycountry.countries.lookup("Brazil")
         query = ExportQuery(countries=frozenset({brazil}))
         urls = api.urls_export(query)
         assert len(urls) == 1
@@ -286,12 +334,12 @@ class TestRepeaterBookAPIUrls:
         assert "exportROW.php" in url_str
         assert "Brazil" in url_str
 
-    def test_urls_export_mixed_countries_routes_to_both(self) -> None:
+    def test_urls_export_mixed_countries_routes_to_both(
+        self, united_states: Country, brazil: Country
+    ) -> None:
         """Query with both NA and ROW countries should query both endpoints."""
         api = RepeaterBookAPI()
-        us = pycountry.countries.lookup("United States")
-        brazil = pycountry.countries.lookup("Brazil")
-        query = ExportQuery(countries=frozenset({us, brazil}))
+        query = ExportQuery(countries=frozenset({united_states, brazil}))
         urls = api.urls_export(query)
         assert len(urls) == 2
 
@@ -367,6 +415,55 @@ class TestRepeaterBookAPIExport:
             with pytest.raises(RepeaterBookAPIError, match="Rate limited"):
                 await api.export_json(url)
 
+    @pytest.mark.anyio
+    async def test_export_multi_json_raises_api_error(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+    ) -> None:
+        """export_multi_json should raise the failing export's own error."""
+
+        async def handler(_: web.Request) -> web.Response:
+            return web.json_response({"status": "error", "message": "Rate limited"})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path))
+            with pytest.raises(RepeaterBookAPIError, match="Rate limited"):
+                await api.export_multi_json({url % {"q": "a"}, url % {"q": "b"}})
+
+    @pytest.mark.anyio
+    async def test_export_multi_json_keeps_every_error(
+        self,
+        tmp_path: StdPath,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """export_multi_json should chain the errors of every failed export."""
+        errors = {
+            "a": RepeaterBookAPIError("Rate limited"),
+            "b": RepeaterBookValidationError("Malformed"),
+        }
+
+        async def export_json(
+            _: RepeaterBookAPI,
+            url: URL,
+            *,
+            session: aiohttp.ClientSession | None = None,  # noqa: ARG001
+        ) -> ExportJSON:
+            # Let every export start before any fails, so none are cancelled.
+            await asyncio.sleep(0)
+            raise errors[url.query["q"]]
+
+        monkeypatch.setattr(RepeaterBookAPI, "export_json", export_json)
+
+        api = RepeaterBookAPI(working_dir=Path(tmp_path))
+        with pytest.raises((RepeaterBookAPIError, RepeaterBookValidationError)) as e:
+            await api.export_multi_json(
+                {URL("http://example.com/?q=a"), URL("http://example.com/?q=b")}
+            )
+
+        assert isinstance(e.value.__cause__, ExceptionGroup)
+        assert set(e.value.__cause__.exceptions) == set(errors.values())
+
     @pytest.mark.anyio
     async def test_export_json_raises_on_missing_count(
         self,
@@ -415,3 +512,271 @@ class TestRepeaterBookAPIExport:
             result = await api.export_json(url)
             assert result["count"] == 1
             assert len(result["results"]) == 1
+
+    @pytest.mark.anyio
+    async def test_export_multi_json_sends_identity_headers(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+    ) -> None:
+        """export_multi_json should send the identity headers with every URL."""
+        user_agents: list[str] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            user_agents.append(request.headers["User-Agent"])
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path))
+            results = await api.export_multi_json({url % {"q": "a"}, url % {"q": "b"}})
+
+        assert len(results) == 2
+        assert user_agents == [api.headers["User-Agent"]] * 2
+
+    @pytest.mark.anyio
+    async def test_export_multi_json_shares_one_bounded_session(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """export_multi_json should fetch every URL over a shared session."""
+        sessions: list[aiohttp.ClientSession] = []
+        limits: list[int] = []
+        used_sessions: list[aiohttp.ClientSession | None] = []
+        create_session = RepeaterBookAPI.session
+        export_json = RepeaterBookAPI.export_json
+
+        def session(self: RepeaterBookAPI) -> aiohttp.ClientSession:
+            sessions.append(create_session(self))
+            # The connector is detached when the session closes, so check it now.
+            assert sessions[-1].connector is not None
+            limits.append(sessions[-1].connector.limit)
+            return sessions[-1]
+
+        async def export(
+            self: RepeaterBookAPI,
+            url: URL,
+            *,
+            session: aiohttp.ClientSession | None = None,
+        ) -> ExportJSON:
+            used_sessions.append(session)
+            return await export_json(self, url, session=session)
+
+        monkeypatch.setattr(RepeaterBookAPI, "session", session)
+        monkeypatch.setattr(RepeaterBookAPI, "export_json", export)
+
+        async def handler(_: web.Request) -> web.Response:
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path), max_connections=2)
+            await api.export_multi_json({url % {"q": q} for q in "abc"})
+
+        assert len(sessions) == 1
+        assert used_sessions == [sessions[0]] * 3
+        assert limits == [2]
+
+    @pytest.mark.anyio
+    async def test_download_many_fetches_shared_urls_once(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+    ) -> None:
+        """download_many should deduplicate export URLs across queries."""
+        state: dict[str, int] = {"calls": 0}
+
+        async def handler(_: web.Request) -> web.Response:
+            state["calls"] += 1
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler, path="/api/export.php") as url:
+            api = RepeaterBookAPI(
+                base_url=url.with_path(""), working_dir=Path(tmp_path)
+            )
+            repeaters = await api.download_many(
+                [
+                    ExportQuery(state_ids=frozenset({"06"})),
+                    ExportQuery(state_ids=frozenset({"48"})),
+                    ExportQuery(state_ids=frozenset({"06"})),
+                ]
+            )
+
+        assert repeaters == []
+        assert state["calls"] == 2
+
+    @pytest.mark.anyio
+    async def test_download_matches_download_many(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+        minimal_payload: dict[str, Any],
+    ) -> None:
+        """download() should return the same repeaters as download_many()."""
+
+        async def handler(_: web.Request) -> web.Response:
+            return web.json_response({"count": 1, "results": [minimal_payload]})
+
+        query = ExportQuery(state_ids=frozenset({"06"}))
+        async with local_server(handler, path="/api/export.php") as url:
+            api = RepeaterBookAPI(
+                base_url=url.with_path(""), working_dir=Path(tmp_path)
+            )
+            repeaters = await api.download(query)
+            expected = await api.download_many([query])
+
+        assert [r.repeater_id for r in repeaters] == [123]
+        assert repeaters == expected
+
+    @pytest.mark.anyio
+    async def test_export_json_reuses_parsed_export(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+    ) -> None:
+        """Repeated exports of a URL should be served from memory."""
+        state: dict[str, int] = {"calls": 0}
+
+        async def handler(_: web.Request) -> web.Response:
+            state["calls"] += 1
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path))
+            first = await api.export_json(url)
+            async for cache_file in (await api.cache_dir()).glob("api_cache_*.json"):
+                await cache_file.unlink()
+            second = await api.export_json(url)
+
+        assert second == first
+        assert state["calls"] == 1
+
+    @pytest.mark.anyio
+    async def test_export_json_memory_cache_is_not_modified_by_callers(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+    ) -> None:
+        """Changing an export's results should not change later exports."""
+
+        async def handler(_: web.Request) -> web.Response:
+            return web.json_response({"count": 1, "results": [{"Rptr ID": 1}]})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path))
+            first = await api.export_json(url)
+            first["results"].clear()
+            second = await api.export_json(url)
+
+        assert second["results"] == [{"Rptr ID": 1}]
+
+    @pytest.mark.anyio
+    async def test_export_json_memory_cache_can_be_disabled(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+    ) -> None:
+        """With no cached exports, repeated exports should read the disk cache."""
+        state: dict[str, int] = {"calls": 0}
+
+        async def handler(_: web.Request) -> web.Response:
+            state["calls"] += 1
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path), max_cached_exports=0)
+            await api.export_json(url)
+            async for cache_file in (await api.cache_dir()).glob("api_cache_*.json"):
+                await cache_file.unlink()
+            await api.export_json(url)
+
+        assert state["calls"] == 2
+
+    @pytest.mark.anyio
+    async def test_export_json_memory_cache_respects_data_age(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Exports read from an old cache file should expire with that file."""
+        state: dict[str, int] = {"calls": 0}
+
+        async def handler(_: web.Request) -> web.Response:
+            state["calls"] += 1
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler) as url:
+            await RepeaterBookAPI(working_dir=Path(tmp_path)).export_json(url)
+            # Age the cache file to 50 minutes, out of the default 1 hour.
+            now_ns = time.time_ns()
+            async for cache_file in (
+                await RepeaterBookAPI(working_dir=Path(tmp_path)).cache_dir()
+            ).glob("api_cache_*.json"):
+                os.utime(cache_file, ns=(now_ns, now_ns - 50 * 60 * 10**9))
+
+            api = RepeaterBookAPI(working_dir=Path(tmp_path))
+            await api.export_json(url)
+            assert state["calls"] == 1
+
+            # 20 minutes later, the data is 70 minutes old.
+            monkeypatch.setattr(time, "time_ns", lambda: now_ns + 20 * 60 * 10**9)
+            await api.export_json(url)
+
+        assert state["calls"] == 2
+
+    @pytest.mark.anyio
+    async def test_export_json_memory_cache_evicts_least_recently_used(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+    ) -> None:
+        """Only the most recently used exports should be kept in memory."""
+        queries: list[str] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            queries.append(request.query["q"])
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path), max_cached_exports=2)
+
+            async def export(q: str) -> None:
+                await api.export_json(url % {"q": q})
+                # Clear the disk cache, so only the memory cache can skip a request.
+                async for cache_file in (await api.cache_dir()).glob("api_cache_*"):
+                    await cache_file.unlink()
+
+            for q in ("a", "b", "a", "c", "a", "b"):
+                await export(q)
+
+        # "b" was the least recently used when "c" was added, so it was evicted.
+        assert queries == ["a", "b", "c", "b"]
+
+    @pytest.mark.anyio
+    async def test_export_json_memory_cache_drops_expired_exports(
+        self,
+        tmp_path: StdPath,
+        local_server: Any,  # noqa: ANN401
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Expired exports should be dropped from memory, even if refreshing fails."""
+        state: dict[str, int] = {"calls": 0}
+
+        async def handler(_: web.Request) -> web.Response:
+            state["calls"] += 1
+            if state["calls"] > 1:
+                return web.Response(status=500)
+            return web.json_response({"count": 0, "results": []})
+
+        async with local_server(handler) as url:
+            api = RepeaterBookAPI(working_dir=Path(tmp_path))
+            await api.export_json(url)
+
+            now_ns = time.time_ns()
+            monkeypatch.setattr(time, "time_ns", lambda: now_ns + 2 * 60 * 60 * 10**9)
+            with pytest.raises(RepeaterBookAPIError):
+                await api.export_json(url)
+
+        assert state["calls"] == 2
+        assert url not in api._exports  # noqa: SLF001
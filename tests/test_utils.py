@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
-from haversine import Unit  # type: ignore[import-untyped]
+import math
 
-from repeaterbook.utils import LatLon, Radius, SquareBounds, square_bounds
+import pytest
+from haversine import Unit, haversine  # type: ignore[import-untyped]
+
+from repeaterbook.utils import (
+    LatLon,
+    Radius,
+    SquareBounds,
+    angular_half_widths,
+    earth_radius,
+    square_bounds,
+)
 
 
 class TestLatLon:
@@ -54,6 +64,43 @@ class TestSquareBounds:
         assert sb.west == -119.0
 
 
+class TestEarthRadius:
+    """Tests for earth_radius() function."""
+
+    def test_kilometers(self) -> None:
+        """earth_radius should default to the mean radius in kilometers."""
+        assert earth_radius() == pytest.approx(6371.0088)
+
+    def test_matches_haversine(self) -> None:
+        """earth_radius should agree with haversine in every unit."""
+        for unit in Unit:
+            # A quarter of a great circle.
+            distance = haversine((0.0, 0.0), (0.0, 90.0), unit=unit)
+            assert earth_radius(unit) * math.pi / 2 == pytest.approx(distance)
+
+
+class TestAngularHalfWidths:
+    """Tests for angular_half_widths() function."""
+
+    def test_widest_longitude(self) -> None:
+        """Longitude half-width should reach the circle's widest longitudes."""
+        # At 60N, a 1000 km circle reaches about 18.2 degrees east and west.
+        origin = LatLon(lat=60.0, lon=0.0)
+        radius = Radius(origin=origin, distance=1000, unit=Unit.KILOMETERS)
+        half_lat, half_lon = angular_half_widths(radius)
+
+        assert half_lat == pytest.approx(1000 / earth_radius())
+        assert math.degrees(half_lon) == pytest.approx(18.218, abs=1e-3)
+
+    def test_radius_containing_pole(self) -> None:
+        """Longitude half-width should cover every longitude around a pole."""
+        origin = LatLon(lat=-89.0, lon=0.0)  # Near south pole
+        radius = Radius(origin=origin, distance=500, unit=Unit.KILOMETERS)
+        _, half_lon = angular_half_widths(radius)
+
+        assert half_lon == math.pi
+
+
 class TestSquareBoundsFunction:
     """Tests for square_bounds() function."""
 
@@ -91,16 +138,37 @@ class TestSquareBoundsFunction:
             assert bounds.north == 90.0
             assert bounds.south == -90.0
 
+    def test_radius_containing_pole(self) -> None:
+        """square_bounds should include the pole and every longitude."""
+        origin = LatLon(lat=89.0, lon=0.0)  # Near north pole
+        radius = Radius(origin=origin, distance=500, unit=Unit.KILOMETERS)
+        bounds = square_bounds(radius)
+
+        assert bounds.south < origin.lat
+        assert bounds.north == 90.0
+        assert bounds.west == -180.0
+        assert bounds.east == 180.0
+
+    def test_widest_longitude(self) -> None:
+        """square_bounds should contain the circle's widest longitudes."""
+        # At 60N, a 1000 km circle reaches about 18.2 degrees east and west,
+        # north of due east and west of the origin.
+        origin = LatLon(lat=60.0, lon=0.0)
+        radius = Radius(origin=origin, distance=1000, unit=Unit.KILOMETERS)
+        bounds = square_bounds(radius)
+
+        assert bounds.east > 18.2
+        assert bounds.west < -18.2
+
     def test_large_radius_wraps_longitude(self) -> None:
         """square_bounds should handle large radius that wraps around meridian."""
         origin = LatLon(lat=0.0, lon=179.0)  # Near date line
         radius = Radius(origin=origin, distance=500, unit=Unit.KILOMETERS)
         bounds = square_bounds(radius)
 
-        # When west goes past the date line (180), it should open up to full range
-        if bounds.west > bounds.east:
-            assert bounds.west == -180.0
-            assert bounds.east == 180.0
+        # When east goes past the date line (180), it should open up to full range
+        assert bounds.west == -180.0
+        assert bounds.east == 180.0
 
     def test_equator(self) -> None:
         """square_bounds should work at equator."""